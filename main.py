@@ -8,12 +8,13 @@ rich structured content (carousel format) compatible with ChatGPT widgets.
 
 from __future__ import annotations
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
-from copy import deepcopy
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
 from fastapi.responses import RedirectResponse
-from pydantic import BaseModel, Field, ConfigDict, ValidationError
+from pydantic import BaseModel, Field, ConfigDict
 
 import mcp.types as types
 from mcp.server.fastmcp import FastMCP
@@ -27,54 +28,100 @@ logger = logging.getLogger("news-mcp")
 # --------------------------------------------------------------------
 # Mock Data
 # --------------------------------------------------------------------
-MOCK_NEWS_DATA = {
-    "technology": [
-        {
-            "id": "tech-1",
-            "title": "AI Breakthrough in Natural Language Processing",
-            "summary": "Researchers achieve new milestone in AI understanding with transformers.",
-            "author": "Dr. Sarah Chen",
-            "published_at": "2025-01-15T10:30:00Z",
-            "category": "technology",
-            "image_url": "https://via.placeholder.com/400x200/0066cc/white?text=AI+News",
-            "url": "https://example.com/tech-1",
-        },
-        {
-            "id": "tech-2",
-            "title": "Quantum Computing Reaches New Milestone",
-            "summary": "IBM announces breakthrough in quantum error correction.",
-            "author": "Michael Rodriguez",
-            "published_at": "2025-01-14T14:45:00Z",
-            "category": "technology",
-            "image_url": "https://via.placeholder.com/400x200/6600cc/white?text=Quantum+Computing",
-            "url": "https://example.com/tech-2",
-        },
-    ],
-    "business": [
-        {
-            "id": "biz-1",
-            "title": "Global Markets Rally on Economic Optimism",
-            "summary": "Stocks worldwide rise amid positive indicators.",
-            "author": "Jennifer Walsh",
-            "published_at": "2025-01-15T08:15:00Z",
-            "category": "business",
-            "image_url": "https://via.placeholder.com/400x200/cc6600/white?text=Market+Rally",
-            "url": "https://example.com/biz-1",
-        }
-    ],
-    "sports": [
-        {
-            "id": "sports-1",
-            "title": "Championship Finals This Weekend",
-            "summary": "Two powerhouse teams prepare for the ultimate showdown.",
-            "author": "David Kim",
-            "published_at": "2025-01-15T16:20:00Z",
-            "category": "sports",
-            "image_url": "https://via.placeholder.com/400x200/cc0066/white?text=Championship",
-            "url": "https://example.com/sports-1",
-        }
-    ],
+@dataclass(slots=True, frozen=True)
+class Article:
+    """A single news article."""
+    id: str
+    title: str
+    summary: str
+    author: str
+    published_at: str
+    category: str
+    image_url: str
+    url: str
+
+MOCK_NEWS_DATA: Dict[str, Tuple[Article, ...]] = {
+    "technology": (
+        Article(
+            id="tech-1",
+            title="AI Breakthrough in Natural Language Processing",
+            summary="Researchers achieve new milestone in AI understanding with transformers.",
+            author="Dr. Sarah Chen",
+            published_at="2025-01-15T10:30:00Z",
+            category="technology",
+            image_url="https://via.placeholder.com/400x200/0066cc/white?text=AI+News",
+            url="https://example.com/tech-1",
+        ),
+        Article(
+            id="tech-2",
+            title="Quantum Computing Reaches New Milestone",
+            summary="IBM announces breakthrough in quantum error correction.",
+            author="Michael Rodriguez",
+            published_at="2025-01-14T14:45:00Z",
+            category="technology",
+            image_url="https://via.placeholder.com/400x200/6600cc/white?text=Quantum+Computing",
+            url="https://example.com/tech-2",
+        ),
+    ),
+    "business": (
+        Article(
+            id="biz-1",
+            title="Global Markets Rally on Economic Optimism",
+            summary="Stocks worldwide rise amid positive indicators.",
+            author="Jennifer Walsh",
+            published_at="2025-01-15T08:15:00Z",
+            category="business",
+            image_url="https://via.placeholder.com/400x200/cc6600/white?text=Market+Rally",
+            url="https://example.com/biz-1",
+        ),
+    ),
+    "sports": (
+        Article(
+            id="sports-1",
+            title="Championship Finals This Weekend",
+            summary="Two powerhouse teams prepare for the ultimate showdown.",
+            author="David Kim",
+            published_at="2025-01-15T16:20:00Z",
+            category="sports",
+            image_url="https://via.placeholder.com/400x200/cc0066/white?text=Championship",
+            url="https://example.com/sports-1",
+        ),
+    ),
+}
+
+# --------------------------------------------------------------------
+# Precomputed Carousel Items
+# --------------------------------------------------------------------
+_by_published = attrgetter("published_at")
+
+_SORTED_BY_CATEGORY: Dict[str, Tuple[Article, ...]] = {
+    key: tuple(sorted(articles, key=_by_published, reverse=True))
+    for key, articles in MOCK_NEWS_DATA.items()
+}
+
+_ALL_SORTED: Tuple[Article, ...] = tuple(
+    sorted(chain.from_iterable(_SORTED_BY_CATEGORY.values()), key=_by_published, reverse=True)
+)
+
+def _carousel_item(a: Article) -> Dict[str, Any]:
+    return {
+        "title": a.title,
+        "subtitle": f"{a.category.title()} — {a.author}",
+        "description": a.summary,
+        "image_url": a.image_url,
+        "link": {"url": a.url, "label": "Read full article →"},
+    }
+
+_PRECOMPUTED_ITEMS: Dict[str, Tuple[Dict[str, Any], ...]] = {
+    key: tuple(_carousel_item(a) for a in articles)
+    for key, articles in _SORTED_BY_CATEGORY.items()
 }
+_PRECOMPUTED_ITEMS["__all__"] = tuple(_carousel_item(a) for a in _ALL_SORTED)
+
+# Case variants clients commonly send, so most lookups skip str.casefold().
+_CAT_ALIAS: Dict[str, str] = {k: k for k in MOCK_NEWS_DATA}
+_CAT_ALIAS.update({k.title(): k for k in MOCK_NEWS_DATA})
+_CAT_ALIAS.update({k.upper(): k for k in MOCK_NEWS_DATA})
 
 # --------------------------------------------------------------------
 # MCP Setup
@@ -93,6 +140,7 @@ class NewsInput(BaseModel):
     )
     model_config = ConfigDict(extra="forbid")
 
+# Shared as-is by every tool listing; treat as read-only.
 TOOL_INPUT_SCHEMA: Dict[str, Any] = {
     "type": "object",
     "properties": {
@@ -131,14 +179,13 @@ HTML_TEMPLATE = """
 
 TEMPLATE_URI = "ui://widget/get_news.html"
 
-def _meta() -> Dict[str, Any]:
-    return {
-        "openai/outputTemplate": TEMPLATE_URI,
-        "openai/toolInvocation/invoking": "Fetching latest news",
-        "openai/toolInvocation/invoked": "Displayed news carousel",
-        "openai/widgetAccessible": True,
-        "openai/resultCanProduceWidget": True,
-    }
+_META: Dict[str, Any] = {
+    "openai/outputTemplate": TEMPLATE_URI,
+    "openai/toolInvocation/invoking": "Fetching latest news",
+    "openai/toolInvocation/invoked": "Displayed news carousel",
+    "openai/widgetAccessible": True,
+    "openai/resultCanProduceWidget": True,
+}
 
 def _embedded_widget() -> types.EmbeddedResource:
     return types.EmbeddedResource(
@@ -151,103 +198,100 @@ def _embedded_widget() -> types.EmbeddedResource:
         ),
     )
 
+_EMBEDDED_WIDGET = _embedded_widget()
+_WIDGET_DUMP: Dict[str, Any] = _EMBEDDED_WIDGET.model_dump(
+    mode="json", exclude_none=True, exclude_unset=True
+)
+_CALL_TOOL_META: Dict[str, Any] = {
+    "openai/widget": _WIDGET_DUMP,
+    "openai/resultCanProduceWidget": True,
+    "openai/widgetAccessible": True,
+    "openai/outputTemplate": TEMPLATE_URI,
+}
+
 # --------------------------------------------------------------------
 # Tool Listing
 # --------------------------------------------------------------------
-@mcp._mcp_server.list_tools()
-async def _list_tools() -> List[types.Tool]:
-    return [
-        types.Tool(
-            name=TOOL_NAME,
-            title=TOOL_TITLE,
-            description=TOOL_DESCRIPTION,
-            inputSchema=deepcopy(TOOL_INPUT_SCHEMA),
-            _meta=_meta(),
-        )
-    ]
+_TOOLS: List[types.Tool] = [
+    types.Tool(
+        name=TOOL_NAME,
+        title=TOOL_TITLE,
+        description=TOOL_DESCRIPTION,
+        inputSchema=TOOL_INPUT_SCHEMA,
+        _meta=_META,
+    )
+]
 
-@mcp._mcp_server.list_resources()
-async def _list_resources() -> List[types.Resource]:
-    return [
-        types.Resource(
-            name=TOOL_TITLE,
-            title=TOOL_TITLE,
-            uri=TEMPLATE_URI,
-            description="HTML template for rendering the news carousel",
-            mimeType=MIME_TYPE,
-            _meta=_meta(),
-        )
-    ]
+_RESOURCES: List[types.Resource] = [
+    types.Resource(
+        name=TOOL_TITLE,
+        title=TOOL_TITLE,
+        uri=TEMPLATE_URI,
+        description="HTML template for rendering the news carousel",
+        mimeType=MIME_TYPE,
+        _meta=_META,
+    )
+]
+
+_LIST_TOOLS_RESULT = types.ServerResult(types.ListToolsResult(tools=_TOOLS))
+_LIST_RESOURCES_RESULT = types.ServerResult(types.ListResourcesResult(resources=_RESOURCES))
+
+async def _list_tools(req: types.ListToolsRequest) -> types.ServerResult:
+    return _LIST_TOOLS_RESULT
+
+async def _list_resources(req: types.ListResourcesRequest) -> types.ServerResult:
+    return _LIST_RESOURCES_RESULT
+
+mcp._mcp_server.request_handlers[types.ListToolsRequest] = _list_tools
+mcp._mcp_server.request_handlers[types.ListResourcesRequest] = _list_resources
 
 # --------------------------------------------------------------------
 # Main Tool Handler
 # --------------------------------------------------------------------
-async def _call_tool(req: types.CallToolRequest) -> types.ServerResult:
-    if req.params.name != TOOL_NAME:
-        return types.ServerResult(
-            types.CallToolResult(
-                content=[types.TextContent(type="text", text="Unknown tool")],
-                isError=True,
-            )
-        )
-
-    try:
-        payload = NewsInput.model_validate(req.params.arguments or {})
-        category = payload.category
-    except ValidationError as e:
-        return types.ServerResult(
-            types.CallToolResult(
-                content=[types.TextContent(type="text", text=f"Validation error: {e.errors()}")],
-                isError=True,
-            )
+_NEWS_RESULTS: Dict[str, types.ServerResult] = {
+    key: types.ServerResult(
+        types.CallToolResult(
+            content=[_EMBEDDED_WIDGET],
+            structuredContent={"title": "Latest News 🗞️", "items": items},
+            _meta=_CALL_TOOL_META,
         )
+    )
+    for key, items in _PRECOMPUTED_ITEMS.items()
+}
 
-    # Get news
-    if category and category.lower() in MOCK_NEWS_DATA:
-        articles = MOCK_NEWS_DATA[category.lower()]
-    else:
-        articles = [a for v in MOCK_NEWS_DATA.values() for a in v]
-
-    articles.sort(key=lambda a: a["published_at"], reverse=True)
-
-    structured = {
-        "title": "Latest News 🗞️",
-        "items": [
-            {
-                "title": a["title"],
-                "subtitle": f"{a['category'].title()} — {a['author']}",
-                "description": a["summary"],
-                "image_url": a["image_url"],
-                "link": {"url": a["url"], "label": "Read full article →"},
-            }
-            for a in articles
-        ],
-    }
-
-    widget = _embedded_widget()
-    # Note: ensure widget.model_dump returns the correct dict
-    meta = {
-        "openai/widget": widget.model_dump(mode="json"),
-        "openai/resultCanProduceWidget": True,
-        "openai/widgetAccessible": True,
-        "openai/outputTemplate": TEMPLATE_URI,
-    }
-
+def _error_result(text: str) -> types.ServerResult:
     return types.ServerResult(
         types.CallToolResult(
-            content=[
-                types.TextResourceContents(
-                    uri=TEMPLATE_URI,
-                    mimeType=MIME_TYPE,
-                    text=HTML_TEMPLATE,
-                    title=TOOL_TITLE,
-                )
-            ],
-            structuredContent=structured,
-            _meta=meta,
+            content=[types.TextContent(type="text", text=text)],
+            isError=True,
         )
     )
 
+_UNKNOWN_TOOL_RESULT = _error_result("Unknown tool")
+_INVALID_CATEGORY_RESULT = _error_result("Validation error: category must be a string")
+_NEWS_INPUT_FIELDS = frozenset(NewsInput.model_fields)
+
+def _build_result(req: types.CallToolRequest) -> types.ServerResult:
+    if req.params.name != TOOL_NAME:
+        return _UNKNOWN_TOOL_RESULT
+
+    args = req.params.arguments or {}
+    extra = args.keys() - _NEWS_INPUT_FIELDS
+    if extra:
+        return _error_result(f"Validation error: unexpected fields: {','.join(sorted(extra))}")
+    category = args.get("category")
+    if category is not None and not isinstance(category, str):
+        return _INVALID_CATEGORY_RESULT
+
+    # Get news
+    key = None
+    if category:
+        key = _CAT_ALIAS.get(category) or _CAT_ALIAS.get(category.casefold())
+    return _NEWS_RESULTS[key or "__all__"]
+
+async def _call_tool(req: types.CallToolRequest) -> types.ServerResult:
+    return _build_result(req)
+
 
 # Register the handler
 mcp._mcp_server.request_handlers[types.CallToolRequest] = _call_tool
@@ -282,4 +326,7 @@ async def redirect_well_known():
 if __name__ == "__main__":
     import uvicorn, os
     port = int(os.environ.get("PORT", 8000))
-    uvicorn.run("main:app", host="0.0.0.0", port=port)
+    # The server is stateless, so it can run several workers. os.cpu_count()
+    # reports the host's cores inside containers, so default to one.
+    workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+    uvicorn.run("main:app", host="0.0.0.0", port=port, workers=workers)
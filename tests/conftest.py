@@ -0,0 +1,27 @@
+import inspect
+import sys
+from pathlib import Path
+
+import fastmcp
+from fastapi import FastAPI
+from mcp.server.fastmcp import FastMCP
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# main.py calls streamable_http_app(base_path=...) and adds FastAPI routes to
+# the result. mcp releases without base_path return a bare Starlette app, so
+# mount it under a FastAPI app for the tests.
+if "base_path" not in inspect.signature(FastMCP.streamable_http_app).parameters:
+    _streamable_http_app = FastMCP.streamable_http_app
+
+    def _streamable_http_app_with_base_path(self, base_path: str = "/"):
+        app = FastAPI()
+        app.mount(base_path, _streamable_http_app(self))
+        return app
+
+    FastMCP.streamable_http_app = _streamable_http_app_with_base_path
+
+# main_with_widgets.py mounts mcp.get_asgi_app(), which fastmcp 2.x replaced
+# with http_app().
+if not hasattr(fastmcp.FastMCP, "get_asgi_app"):
+    fastmcp.FastMCP.get_asgi_app = lambda self: self.http_app()
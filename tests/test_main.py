@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+from mcp import types
+
+import main
+
+
+def _call(arguments, name: str = "get_news") -> types.CallToolResult:
+    handler = main.mcp._mcp_server.request_handlers[types.CallToolRequest]
+    req = types.CallToolRequest(
+        method="tools/call",
+        params=types.CallToolRequestParams(name=name, arguments=arguments),
+    )
+    return asyncio.run(handler(req)).root
+
+
+def _titles(result: types.CallToolResult):
+    return [item["title"] for item in result.structuredContent["items"]]
+
+
+ALL_TITLES = [
+    "Championship Finals This Weekend",
+    "AI Breakthrough in Natural Language Processing",
+    "Global Markets Rally on Economic Optimism",
+    "Quantum Computing Reaches New Milestone",
+]
+
+
+@pytest.mark.parametrize("arguments", [{}, {"category": ""}, {"category": "weather"}])
+def test_get_news_defaults_to_all_articles(arguments):
+    result = _call(arguments)
+    assert not result.isError
+    assert _titles(result) == ALL_TITLES
+    assert result.content == [main._EMBEDDED_WIDGET]
+
+
+@pytest.mark.parametrize("category", ["sports", "Sports", "SPORTS", "sPoRtS"])
+def test_get_news_resolves_category_case_insensitively(category):
+    result = _call({"category": category})
+    assert not result.isError
+    assert _titles(result) == ["Championship Finals This Weekend"]
+
+
+def test_get_news_rejects_non_string_category():
+    result = _call({"category": 5})
+    assert result.isError
+    assert result.content[0].text == "Validation error: category must be a string"
+
+
+def test_get_news_rejects_unexpected_fields():
+    result = _call({"foo": 1})
+    assert result.isError
+    assert result.content[0].text == "Validation error: unexpected fields: foo"
+
+
+def test_unknown_tool():
+    result = _call({}, name="get_weather")
+    assert result.isError
+    assert result.content[0].text == "Unknown tool"
@@ -0,0 +1,40 @@
+import asyncio
+
+import pytest
+from mcp import types
+
+import main_with_widgets
+
+
+def _read(uri: str) -> types.ServerResult:
+    handler = main_with_widgets.mcp._mcp_server.request_handlers[types.ReadResourceRequest]
+    req = types.ReadResourceRequest(
+        method="resources/read",
+        params=types.ReadResourceRequestParams(uri=uri),
+    )
+    return asyncio.run(handler(req))
+
+
+def test_read_resource_returns_widget_html():
+    result = _read("ui://widget/news-carousel.html")
+    contents = result.root.contents
+    assert len(contents) == 1
+    assert contents[0].text == main_with_widgets.CAROUSEL_HTML
+    assert contents[0].mimeType == main_with_widgets.MIME_TYPE
+
+
+def test_read_resource_unknown_uri():
+    with pytest.raises(ValueError, match="Resource not found"):
+        _read("ui://widget/missing.html")
+
+
+def test_list_resources_returns_prebuilt_listing():
+    handler = main_with_widgets.mcp._mcp_server.request_handlers[types.ListResourcesRequest]
+    result = asyncio.run(handler(types.ListResourcesRequest(method="resources/list")))
+    assert [str(r.uri) for r in result.root.resources] == ["ui://widget/news-carousel.html"]
+
+
+def test_list_tools_returns_prebuilt_listing():
+    handler = main_with_widgets.mcp._mcp_server.request_handlers[types.ListToolsRequest]
+    result = asyncio.run(handler(types.ListToolsRequest(method="tools/list")))
+    assert [t.name for t in result.root.tools] == ["news-carousel"]